@@ -8,7 +8,7 @@ Analyzes git repository commit history, categorizes changes by type (Added, Chan
 groups commits by semantic version tags, and generates beautifully formatted CHANGELOG.md files.
 
 Features:
-- Zero external dependencies (Python stdlib only)
+- Zero external dependencies (Python stdlib only; uses orjson for JSON if installed)
 - Conventional commits support (feat:, fix:, docs:, etc.)
 - Semantic versioning (v1.0.0, v2.1.3, etc.)
 - Multiple output formats (Markdown, JSON, Plain Text)
@@ -23,23 +23,41 @@ Date: February 10, 2026
 License: MIT
 """
 
-import argparse
-import json
+import io
 import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass, asdict
+import tempfile
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Pattern, TextIO, Tuple
+
+try:
+    import orjson  # Optional: faster JSON encoding when installed
+except ImportError:
+    orjson = None
+
+# argparse, json and concurrent.futures are imported where they are used:
+# each is only needed on some paths and together they dominate import time.
 
 
 # ═══════════════════════════════════════════════════════════════════
 # DATA STRUCTURES
 # ═══════════════════════════════════════════════════════════════════
 
+# __slots__ drops the per-instance __dict__ (~35% less memory per Commit);
+# dataclass only generates them on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class Category(Enum):
     """Standard changelog categories following keepachangelog.com."""
     ADDED = "Added"
@@ -48,25 +66,28 @@ class Category(Enum):
     REMOVED = "Removed"
     FIXED = "Fixed"
     SECURITY = "Security"
+    
+    # Members are singletons, so identity hashing is consistent with equality
+    # and avoids Enum's Python-level __hash__ in per-commit dict lookups
+    __hash__ = object.__hash__
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Commit:
-    """Represents a single git commit."""
+    """Represents a single git commit (category is set by CommitCategorizer)."""
     hash: str
     author: str
     email: str
     date: datetime
     message: str
+    category: Optional[Category] = None
 
 
-@dataclass
-class CategorizedCommit(Commit):
-    """Commit with assigned category."""
-    category: Category
+# Backwards-compatible name: categorized commits are plain Commits
+CategorizedCommit = Commit
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Tag:
     """Represents a git version tag."""
     name: str
@@ -74,12 +95,12 @@ class Tag:
     date: datetime
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VersionGroup:
-    """Group of commits for a specific version."""
+    """Group of commits for a specific version (categories in display order)."""
     version: str
     date: Optional[datetime]
-    commits_by_category: Dict[Category, List[CategorizedCommit]]
+    commits_by_category: Dict[Category, List[Commit]]
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -104,13 +125,93 @@ DEFAULT_CONFIG = {
     "date_format": "%Y-%m-%d"
 }
 
+# Minimum batch size before categorization is spread across processes
+PARALLEL_MIN_COMMITS = 1000
+
+# Conventional commit prefix stripped from messages when formatting
+CONVENTIONAL_TYPES = ('feat', 'fix', 'docs', 'style', 'refactor', 'perf', 'test', 'chore', 'build', 'ci')
+CONVENTIONAL_PREFIX_RE = re.compile(rf"^({'|'.join(CONVENTIONAL_TYPES)})(\(.+?\))?:\s*")
+
 
 # ═══════════════════════════════════════════════════════════════════
 # COMPONENT 1: GIT LOG PARSER
 # ═══════════════════════════════════════════════════════════════════
 
+GIT_NOT_INSTALLED = "Git is not installed. Install from https://git-scm.com/"
+
+# ASCII unit separator between fields of git's formatted output. Unlike '|',
+# it can't turn up in author names, subjects or tag names.
+FIELD_SEP = "\x1f"
+
+
+def _check_not_a_repo(stderr: str, repo_path: Path) -> None:
+    """Raise ValueError if git failed because repo_path is not a repository."""
+    if "not a git repository" in stderr.lower():
+        raise ValueError(f"Not a git repository: {repo_path}")
+
+
+def _git_options(text: bool = True) -> Dict:
+    """
+    Common subprocess options for git invocations.
+    
+    With text=True, output is decoded as UTF-8 regardless of the platform
+    locale; pass text=False to receive bytes and decode them yourself. LC_ALL=C
+    skips git's message translation (and keeps stderr matchable), and
+    GIT_OPTIONAL_LOCKS=0 stops read-only commands from taking index.lock.
+    Descriptors are non-inheritable by default (PEP 446), so close_fds=False
+    is safe and lets CPython use posix_spawn/vfork instead of fork+exec.
+    """
+    env = dict(os.environ)
+    env["LC_ALL"] = "C"
+    env["GIT_OPTIONAL_LOCKS"] = "0"
+    options = {"close_fds": False, "env": env}
+    if text:
+        options.update(text=True, encoding="utf-8", errors="replace")
+    return options
+
+
+def _run_git(repo_path: Path, args: List[str]) -> str:
+    """
+    Run a git command inside a repository and return its stdout.
+    
+    Args:
+        repo_path: Repository to run in (passed as ``git -C``)
+        args: Git arguments, e.g. ["log", "--oneline"]
+        
+    Returns:
+        Captured stdout, decoded as UTF-8
+        
+    Raises:
+        EnvironmentError: If git is not installed
+        ValueError: If repo_path is not a git repository
+        subprocess.CalledProcessError: If git fails for any other reason
+            (its stderr is decoded to str)
+    """
+    # Captured output is decoded in one call once git exits, rather than
+    # through an incremental text-mode decoder
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_path)] + args,
+            capture_output=True,
+            check=True,
+            **_git_options(text=False)
+        )
+    except FileNotFoundError:
+        raise EnvironmentError(GIT_NOT_INSTALLED)
+    except subprocess.CalledProcessError as e:
+        e.stderr = e.stderr.decode("utf-8", "replace")
+        _check_not_a_repo(e.stderr, repo_path)
+        raise
+    return result.stdout.decode("utf-8", "replace")
+
+
 class GitLogParser:
-    """Parse git commit history and version tags."""
+    """
+    Parse git commit history and version tags.
+    
+    The repository is validated by the first git command that runs rather
+    than by a separate probe, saving one subprocess per parser.
+    """
     
     def __init__(self, repo_path: Path):
         """
@@ -120,49 +221,64 @@ class GitLogParser:
             repo_path: Path to git repository root
             
         Raises:
-            ValueError: If path is not a valid git repository
-            EnvironmentError: If git is not installed
+            ValueError: If path does not exist
         """
         self.repo_path = Path(repo_path).resolve()
-        self._validate_git_repo()
-    
-    def _validate_git_repo(self) -> None:
-        """Validate that path is a git repository with git installed."""
         if not self.repo_path.exists():
             raise ValueError(f"Repository path does not exist: {self.repo_path}")
         
-        try:
-            result = subprocess.run(
-                ["git", "-C", str(self.repo_path), "rev-parse", "--git-dir"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-        except FileNotFoundError:
-            raise EnvironmentError("Git is not installed. Install from https://git-scm.com/")
-        except subprocess.CalledProcessError as e:
-            if "not a git repository" in e.stderr.lower():
-                raise ValueError(f"Not a git repository: {self.repo_path}")
-            raise RuntimeError(f"Git command failed: {e.stderr}")
+        # Tag data doesn't depend on call arguments; cached after the first call
+        self._tags: Optional[List[Tag]] = None
+        self._tag_ranges: Optional[Dict[str, List[str]]] = None
     
     def parse_commits(self, since_date: Optional[datetime] = None,
-                     until_date: Optional[datetime] = None) -> List[Commit]:
+                     until_date: Optional[datetime] = None,
+                     grep: Optional[List[str]] = None) -> List[Commit]:
         """
         Extract all commits from git log.
         
         Args:
             since_date: Optional filter - commits after this date
             until_date: Optional filter - commits before this date
+            grep: Optional filter - commits whose message contains any of these
+                strings (case-insensitive)
             
         Returns:
             List of Commit objects
             
         Raises:
+            ValueError: If path is not a git repository
+            EnvironmentError: If git is not installed
+            RuntimeError: If git command fails
+        """
+        return list(self.iter_commits(since_date, until_date, grep))
+    
+    def iter_commits(self, since_date: Optional[datetime] = None,
+                     until_date: Optional[datetime] = None,
+                     grep: Optional[List[str]] = None) -> Iterator[Commit]:
+        """
+        Stream commits from git log as they are produced.
+        
+        Lines are parsed while git is still walking history, so memory use
+        stays flat regardless of repository size.
+        
+        Args:
+            since_date: Optional filter - commits after this date
+            until_date: Optional filter - commits before this date
+            grep: Optional filter - commits whose message contains any of these
+                strings (case-insensitive), matched by git itself
+            
+        Yields:
+            Commit objects (newest first)
+            
+        Raises:
+            ValueError: If path is not a git repository
+            EnvironmentError: If git is not installed
             RuntimeError: If git command fails
         """
         cmd = [
             "git", "-C", str(self.repo_path), "log",
-            "--pretty=format:%H|%an|%ae|%aI|%s",
+            "--pretty=format:%H%x1f%an%x1f%ae%x1f%aI%x1f%s",
             "--no-merges"  # Skip merge commits
         ]
         
@@ -170,75 +286,166 @@ class GitLogParser:
             cmd.append(f"--since={since_date.isoformat()}")
         if until_date:
             cmd.append(f"--until={until_date.isoformat()}")
+        if grep:
+            # Several --grep patterns match if any of them does
+            cmd += ["--fixed-strings", "--regexp-ignore-case"]
+            cmd += [f"--grep={pattern}" for pattern in grep]
         
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to parse git log: {e.stderr}")
-        
-        if not result.stdout.strip():
-            return []
-        
-        commits = []
-        for line in result.stdout.strip().split('\n'):
-            parts = line.split('|', 4)
-            if len(parts) == 5:
-                commits.append(Commit(
-                    hash=parts[0],
-                    author=parts[1],
-                    email=parts[2],
-                    date=datetime.fromisoformat(parts[3]),
-                    message=parts[4]
-                ))
-        
-        return commits
+        # stderr goes to a file: a pipe nobody reads until stdout hits EOF
+        # would block git (and then us) once warnings fill its buffer
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file,
+                                        **_git_options())
+            except FileNotFoundError:
+                raise EnvironmentError(GIT_NOT_INSTALLED)
+            
+            # Histories have few distinct authors; interning shares one string
+            # per name/email instead of keeping a copy per commit
+            intern = sys.intern
+            with proc:
+                for line in proc.stdout:
+                    parts = line.rstrip('\n').split(FIELD_SEP, 4)
+                    if len(parts) == 5:
+                        yield Commit(
+                            hash=parts[0],
+                            author=intern(parts[1]),
+                            email=intern(parts[2]),
+                            date=datetime.fromisoformat(parts[3]),
+                            message=parts[4]
+                        )
+                
+                if proc.wait() != 0:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode('utf-8', 'replace')
+                    _check_not_a_repo(stderr, self.repo_path)
+                    raise RuntimeError(f"Failed to parse git log: {stderr}")
     
     def parse_tags(self) -> List[Tag]:
         """
         Extract all version tags from git repository.
         
+        The result is cached on this parser; later calls don't run git again.
+        
         Returns:
             List of Tag objects, sorted by version (newest first)
             
         Raises:
+            ValueError: If path is not a git repository
+            EnvironmentError: If git is not installed
             RuntimeError: If git command fails
         """
-        cmd = [
-            "git", "-C", str(self.repo_path), "tag",
-            "--sort=-version:refname",
-            "-l"
-        ]
+        if self._tags is not None:
+            return self._tags
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            output = _run_git(self.repo_path, [
+                "for-each-ref",
+                "--sort=-v:refname",
+                "--format=%(refname:short)%1f%(objectname)%1f%(*objectname)%1f%(creatordate:iso-strict)",
+                "refs/tags"
+            ])
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to parse git tags: {e.stderr}")
         
-        if not result.stdout.strip():
-            return []
+        if not output.strip():
+            self._tags = []
+            return self._tags
         
         tags = []
-        for tag_name in result.stdout.strip().split('\n'):
-            # Get commit hash and date for this tag
-            cmd_show = [
-                "git", "-C", str(self.repo_path), "show", tag_name,
-                "--pretty=format:%H|%aI", "--no-patch"
-            ]
-            
+        for line in output.strip().split('\n'):
+            # Annotated tags point at a tag object; %(*objectname) is the
+            # commit it peels to (empty for lightweight tags)
+            parts = line.split(FIELD_SEP)
+            if len(parts) != 4:
+                continue
+            name, object_hash, peeled_hash, date_str = parts
             try:
-                result_show = subprocess.run(cmd_show, capture_output=True, text=True, check=True)
-                parts = result_show.stdout.strip().split('|')
-                if len(parts) == 2:
-                    tags.append(Tag(
-                        name=tag_name,
-                        commit_hash=parts[0],
-                        date=datetime.fromisoformat(parts[1])
-                    ))
-            except (subprocess.CalledProcessError, ValueError):
+                tags.append(Tag(
+                    name=name,
+                    commit_hash=peeled_hash or object_hash,
+                    date=datetime.fromisoformat(date_str)
+                ))
+            except ValueError:
                 # Skip tags that can't be parsed
                 continue
         
+        self._tags = tags
         return tags
+    
+    def parse_tag_ranges(self) -> Dict[str, List[str]]:
+        """
+        Assign every commit to the tag that releases it, in one history walk.
+        
+        Reads the commit graph once, then visits tags in release order (the
+        version order of parse_tags, oldest first); each tag claims its
+        ancestors that no lower version has claimed, which is the set
+        ``git log <lower version tags>..<tag>`` would list. Commits on merged
+        branches land in the release that merged them, and a commit shared
+        by two release branches goes to the lower version. Tags on the same
+        commit share one range. Commits not reachable from any tag are
+        unreleased and are not included. The result is cached on this
+        parser; later calls don't run git again.
+        
+        Returns:
+            Dict mapping tag name -> commit hashes in that release (newest first)
+            
+        Raises:
+            ValueError: If path is not a git repository
+            EnvironmentError: If git is not installed
+            RuntimeError: If git command fails
+        """
+        if self._tag_ranges is not None:
+            return self._tag_ranges
+        
+        tags = self.parse_tags()
+        
+        try:
+            output = _run_git(self.repo_path, [
+                "log",
+                "--tags",
+                "--topo-order",
+                "--pretty=format:%H%x1f%P"
+            ]) if tags else ""
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to parse git tag ranges: {e.stderr}")
+        
+        # Topological position, used to list each range newest first
+        parents = {}
+        position = {}
+        for line in output.split('\n'):
+            commit_hash, _, parent_hashes = line.partition(FIELD_SEP)
+            if commit_hash:
+                parents[commit_hash] = parent_hashes.split()
+                position[commit_hash] = len(position)
+        
+        # Lowest version first, so an older release keeps its own commits
+        released = [tag for tag in reversed(tags) if tag.commit_hash in position]
+        
+        ranges = {}
+        range_by_commit = {}
+        claimed = set()
+        for tag in released:
+            if tag.commit_hash in range_by_commit:
+                ranges[tag.name] = range_by_commit[tag.commit_hash]
+                continue
+            
+            hashes = []
+            pending = [tag.commit_hash]
+            while pending:
+                commit_hash = pending.pop()
+                # Parents missing from the walk are beyond a shallow clone's edge
+                if commit_hash in claimed or commit_hash not in parents:
+                    continue
+                claimed.add(commit_hash)
+                hashes.append(commit_hash)
+                pending.extend(parents[commit_hash])
+            
+            hashes.sort(key=position.__getitem__)
+            ranges[tag.name] = range_by_commit[tag.commit_hash] = hashes
+        
+        self._tag_ranges = ranges
+        return ranges
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -248,62 +455,155 @@ class GitLogParser:
 class CommitCategorizer:
     """Classify commits into standard categories."""
     
-    def __init__(self, config: Dict = None):
+    # Compiled keyword regexes shared across instances, keyed by category config
+    _keyword_re_cache: Dict[Tuple, Optional[Pattern]] = {}
+    
+    def __init__(self, config: Dict = None, cache_size: int = 0):
         """
         Initialize categorizer with configuration.
         
         Args:
             config: Category keyword configuration (uses DEFAULT_CONFIG if None)
+            cache_size: Remember the category of up to this many distinct
+                messages (default: 0, no cache). Only worth it for histories
+                with many repeated messages; unique messages get slower.
         """
         self.config = config or DEFAULT_CONFIG
         self.categories = self.config.get("categories", {})
+        key = tuple((category, tuple(keywords)) for category, keywords in self.categories.items())
+        try:
+            self._keyword_re = self._keyword_re_cache[key]
+        except KeyError:
+            self._keyword_re = self._keyword_re_cache[key] = self._compile_keywords(self.categories)
+        self._classify = self._build_classifier(self._keyword_re, list(self.categories))
+        if cache_size:
+            # Per instance, since the result depends on this categorizer's keywords
+            self._classify = lru_cache(maxsize=cache_size)(self._classify)
+    
+    @staticmethod
+    def _compile_keywords(categories: Dict) -> Optional[Pattern]:
+        """
+        Build one regex that finds every keyword occurrence in a single scan.
+        
+        A keyword matches at the start of the message or right after a space.
+        Each category gets a named group ``c<rank>``, where rank is its position
+        in the configuration, so callers can let the earliest category win.
+        """
+        groups = []
+        for rank, keywords in enumerate(categories.values()):
+            if keywords:
+                words = '|'.join(re.escape(keyword) for keyword in keywords)
+                groups.append(f"(?P<c{rank}>{words})")
+        
+        if not groups:
+            return None
+        return re.compile(f"(?:^| )(?=(?:{'|'.join(groups)}))", re.DOTALL)
+    
+    @staticmethod
+    def _build_classifier(keyword_re: Optional[Pattern],
+                          ranked_categories: List[Category]) -> Callable[[str], Category]:
+        """
+        Build the message -> category function for a compiled keyword regex.
+        
+        A closure rather than a method, so an LRU cache wrapped around it does
+        not tie the categorizer into a reference cycle.
+        """
+        group_ranks = {f"c{rank}": rank for rank in range(len(ranked_categories))}
+        
+        def classify(message: str) -> Category:
+            if keyword_re is not None:
+                # Earlier-configured categories take precedence over match position
+                best_rank = None
+                for match in keyword_re.finditer(message.lower().strip()):
+                    rank = group_ranks[match.lastgroup]
+                    if best_rank is None or rank < best_rank:
+                        best_rank = rank
+                        if rank == 0:
+                            break
+                if best_rank is not None:
+                    return ranked_categories[best_rank]
+            
+            return Category.CHANGED  # Default if no keyword matches
+        
+        return classify
     
-    def categorize_commit(self, commit: Commit) -> CategorizedCommit:
+    def categorize_commit(self, commit: Commit) -> Commit:
         """
         Classify single commit into category.
         
         Args:
-            commit: Commit to categorize
+            commit: Commit to categorize (its category is set in place)
             
         Returns:
-            CategorizedCommit with assigned category
-        """
-        message_lower = commit.message.lower().strip()
-        
-        # Check each category's keywords
-        for category, keywords in self.categories.items():
-            for keyword in keywords:
-                if message_lower.startswith(keyword) or f" {keyword}" in message_lower:
-                    return CategorizedCommit(
-                        hash=commit.hash,
-                        author=commit.author,
-                        email=commit.email,
-                        date=commit.date,
-                        message=commit.message,
-                        category=category
-                    )
-        
-        # Default to CHANGED if no match
-        return CategorizedCommit(
-            hash=commit.hash,
-            author=commit.author,
-            email=commit.email,
-            date=commit.date,
-            message=commit.message,
-            category=Category.CHANGED
-        )
+            The same Commit with its category assigned
+        """
+        commit.category = self._classify(commit.message)
+        return commit
+    
+    def iter_categorized(self, commits: Iterable[Commit]) -> Iterator[Commit]:
+        """
+        Classify commits lazily, one at a time, as they are consumed.
+        
+        Args:
+            commits: Any iterable of commits (e.g. GitLogParser.iter_commits)
+            
+        Yields:
+            Categorized Commit objects (same order as input)
+        """
+        categorize = self.categorize_commit
+        for commit in commits:
+            yield categorize(commit)
     
-    def categorize_batch(self, commits: List[Commit]) -> List[CategorizedCommit]:
+    def categorize_batch(self, commits: Iterable[Commit],
+                         workers: int = 1) -> List[Commit]:
         """
         Classify multiple commits efficiently.
         
+        Large batches can be split across worker processes. Only the messages
+        are sent to the workers and only the categories come back, so the
+        commits themselves are never pickled. Batches smaller than
+        PARALLEL_MIN_COMMITS are always handled in-process, where the cost
+        of starting workers would outweigh the gain.
+        
         Args:
-            commits: List of commits to categorize
+            commits: Commits to categorize (any iterable, e.g. a generator)
+            workers: Number of worker processes (0 = one per CPU, default: 1)
             
         Returns:
-            List of CategorizedCommit objects
+            List of categorized Commit objects (same order as input)
+            
+        Raises:
+            ValueError: If workers is negative
         """
-        return [self.categorize_commit(commit) for commit in commits]
+        if workers < 0:
+            raise ValueError(f"Invalid number of workers: {workers}")
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        
+        if not isinstance(commits, list):
+            commits = list(commits)
+        
+        if workers <= 1 or len(commits) < PARALLEL_MIN_COMMITS:
+            return [self.categorize_commit(commit) for commit in commits]
+        
+        messages = [commit.message for commit in commits]
+        chunk_size = -(-len(messages) // workers)
+        chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+        
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_categorize_chunk, chunks, [self.config] * len(chunks))
+            categories = chain.from_iterable(results)
+            for commit, category in zip(commits, categories):
+                commit.category = category
+        return commits
+
+
+def _categorize_chunk(messages: List[str], config: Dict) -> List[Category]:
+    """Categorize one slice of commit messages inside a worker process."""
+    classify = CommitCategorizer(config)._classify
+    return [classify(message) for message in messages]
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -323,14 +623,18 @@ class VersionGrouper:
         self.config = config or DEFAULT_CONFIG
         self.tag_pattern = re.compile(self.config.get("tag_pattern", r"v?\d+\.\d+\.\d+"))
     
-    def group_by_version(self, commits: List[CategorizedCommit],
-                        tags: List[Tag]) -> List[VersionGroup]:
+    def group_by_version(self, commits: Iterable[Commit],
+                        tags: List[Tag],
+                        tag_ranges: Optional[Dict[str, List[str]]] = None) -> List[VersionGroup]:
         """
         Group commits by version tags.
         
         Args:
-            commits: List of categorized commits
+            commits: Categorized commits, newest first. Any iterable is
+                accepted; it is consumed in a single pass.
             tags: List of version tags
+            tag_ranges: Tag name -> commit hashes, from GitLogParser.parse_tag_ranges.
+                When omitted, commits are assigned to tags by date.
             
         Returns:
             List of VersionGroup objects (newest first)
@@ -339,49 +643,74 @@ class VersionGrouper:
             # No tags - all commits are "Unreleased"
             return [self._create_version_group("Unreleased", None, commits)]
         
+        if tag_ranges is not None:
+            return self._group_by_ranges(commits, tags, tag_ranges)
+        
+        # Sort once (oldest first) and cut the timeline at each tag date with
+        # a binary search. Sorting the reversed input keeps git's newest-first
+        # order for equal dates once each slice is reversed back in place.
+        ordered = list(commits)
+        ordered.reverse()
+        ordered.sort(key=attrgetter('date'))
+        dates = [c.date for c in ordered]
+        
         groups = []
-        commit_map = {c.hash: c for c in commits}
         
-        # Build commit-to-tag mapping
-        tag_commits = {tag.commit_hash: tag for tag in tags}
+        # Add "Unreleased" for commits after the newest tag
+        unreleased_commits = ordered[bisect_right(dates, tags[0].date):]
+        if unreleased_commits:
+            unreleased_commits.reverse()
+            groups.append(self._create_version_group("Unreleased", None, unreleased_commits))
         
-        # Group commits by tag
+        # Each tag gets the commits after the previous (older) tag, up to its own date
         for i, tag in enumerate(tags):
-            # Get commits between this tag and previous tag (or beginning)
-            if i < len(tags) - 1:
-                # Range: previous_tag..tag
-                prev_tag = tags[i + 1]
-                commits_in_range = self._get_commits_between_tags(
-                    str(self.repo_path) if hasattr(self, 'repo_path') else '.',
-                    prev_tag.name,
-                    tag.name,
-                    commit_map
-                )
-            else:
-                # First tag - all commits up to this tag
-                commits_in_range = [c for c in commits if c.date <= tag.date]
+            start = bisect_right(dates, tags[i + 1].date) if i < len(tags) - 1 else 0
+            commits_in_range = ordered[start:bisect_right(dates, tag.date)]
             
             if commits_in_range:
+                commits_in_range.reverse()
                 version = self._parse_version(tag.name)
                 groups.append(self._create_version_group(version, tag.date, commits_in_range))
         
-        # Add "Unreleased" for commits after the newest tag
-        if tags:
-            newest_tag = tags[0]
-            unreleased_commits = [c for c in commits if c.date > newest_tag.date]
-            if unreleased_commits:
-                groups.insert(0, self._create_version_group("Unreleased", None, unreleased_commits))
+        return groups
+    
+    def _group_by_ranges(self, commits: Iterable[Commit], tags: List[Tag],
+                         tag_ranges: Dict[str, List[str]]) -> List[VersionGroup]:
+        """Group commits using exact tag ranges from the commit graph."""
+        # Tags on the same commit share one range; bucket by the range's
+        # first hash so each of those tags finds the same commits
+        range_by_hash = {
+            commit_hash: hashes[0]
+            for hashes in tag_ranges.values()
+            for commit_hash in hashes
+        }
+        
+        buckets = defaultdict(list)
+        for commit in commits:
+            buckets[range_by_hash.get(commit.hash)].append(commit)
+        
+        groups = []
+        if None in buckets:
+            groups.append(self._create_version_group("Unreleased", None, buckets[None]))
+        
+        for tag in tags:
+            hashes = tag_ranges.get(tag.name)
+            if hashes and hashes[0] in buckets:
+                version = self._parse_version(tag.name)
+                groups.append(self._create_version_group(version, tag.date, buckets[hashes[0]]))
         
         return groups
     
     def _create_version_group(self, version: str, date: Optional[datetime],
-                             commits: List[CategorizedCommit]) -> VersionGroup:
+                             commits: Iterable[Commit]) -> VersionGroup:
         """Create VersionGroup with commits organized by category."""
-        commits_by_category = {}
-        for category in Category:
-            category_commits = [c for c in commits if c.category == category]
-            if category_commits:
-                commits_by_category[category] = category_commits
+        buckets = defaultdict(list)
+        for commit in commits:
+            buckets[commit.category].append(commit)
+        
+        commits_by_category = {
+            category: buckets[category] for category in Category if category in buckets
+        }
         
         return VersionGroup(
             version=version,
@@ -396,13 +725,6 @@ class VersionGrouper:
             version = match.group()
             return version.lstrip('v')  # Remove 'v' prefix if present
         return tag_name
-    
-    def _get_commits_between_tags(self, repo_path: str, tag_from: str,
-                                  tag_to: str, commit_map: Dict) -> List[CategorizedCommit]:
-        """Get commits between two tags (simplified - uses date comparison)."""
-        # This is a simplified implementation
-        # Real implementation would use git rev-list tag_from..tag_to
-        return []
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -433,35 +755,44 @@ class ChangelogFormatter:
         Returns:
             Formatted Markdown string
         """
-        lines = []
-        lines.append("# Changelog\n")
-        lines.append("All notable changes to this project will be documented in this file.\n")
-        lines.append("The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),")
-        lines.append("and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n")
+        buffer = io.StringIO()
+        self.write_markdown(groups, buffer)
+        return buffer.getvalue()
+    
+    def write_markdown(self, groups: List[VersionGroup], out: TextIO) -> None:
+        """
+        Write keepachangelog.com Markdown directly to a text stream.
+        
+        Args:
+            groups: List of VersionGroup objects
+            out: Writable text stream (file, StringIO, ...)
+        """
+        write = out.write
+        write("# Changelog\n\n")
+        write("All notable changes to this project will be documented in this file.\n\n")
+        write("The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),\n")
+        write("and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n")
         
         for group in groups:
             # Version header
             if group.version == "Unreleased":
-                lines.append(f"## [Unreleased]\n")
+                write("\n## [Unreleased]\n")
             else:
-                date_str = group.date.strftime(self.date_format) if group.date else "Unknown"
-                lines.append(f"## [{group.version}] - {date_str}\n")
+                date_str = self._format_date(group.date)
+                write(f"\n## [{group.version}] - {date_str}\n")
             
             # Categories
-            for category in Category:
-                if category in group.commits_by_category:
-                    lines.append(f"### {category.value}\n")
-                    for commit in group.commits_by_category[category]:
-                        message = self._clean_commit_message(commit.message)
-                        if self.include_hashes:
-                            lines.append(f"- {message} ({commit.hash[:7]})")
-                        else:
-                            lines.append(f"- {message}")
-                    lines.append("")  # Blank line after category
+            for category, commits in group.commits_by_category.items():
+                write(f"\n### {category.value}\n")
+                for commit in commits:
+                    message = self._clean_commit_message(commit.message)
+                    if self.include_hashes:
+                        write(f"\n- {message} ({commit.hash[:7]})")
+                    else:
+                        write(f"\n- {message}")
+                write("\n")  # Blank line after category
             
-            lines.append("")  # Blank line after version
-        
-        return '\n'.join(lines)
+            write("\n")  # Blank line after version
     
     def format_json(self, groups: List[VersionGroup]) -> str:
         """
@@ -494,7 +825,12 @@ class ChangelogFormatter:
             
             data.append(version_data)
         
-        return json.dumps(data, indent=2)
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        import json
+        
+        # ensure_ascii=False keeps output identical to orjson's UTF-8 output
+        return json.dumps(data, indent=2, ensure_ascii=False)
     
     def format_text(self, groups: List[VersionGroup]) -> str:
         """
@@ -506,43 +842,67 @@ class ChangelogFormatter:
         Returns:
             Plain text string
         """
-        lines = []
-        lines.append("=" * 70)
-        lines.append("CHANGELOG")
-        lines.append("=" * 70)
-        lines.append("")
+        buffer = io.StringIO()
+        self.write_text(groups, buffer)
+        return buffer.getvalue()
+    
+    def write_text(self, groups: List[VersionGroup], out: TextIO) -> None:
+        """
+        Write plain text directly to a text stream.
+        
+        Args:
+            groups: List of VersionGroup objects
+            out: Writable text stream (file, StringIO, ...)
+        """
+        write = out.write
+        rule = "=" * 70
+        write(f"{rule}\nCHANGELOG\n{rule}\n")
         
         for group in groups:
             if group.version == "Unreleased":
-                lines.append("UNRELEASED")
+                write("\nUNRELEASED")
             else:
-                date_str = group.date.strftime(self.date_format) if group.date else "Unknown"
-                lines.append(f"VERSION {group.version} - {date_str}")
-            lines.append("-" * 70)
-            lines.append("")
+                date_str = self._format_date(group.date)
+                write(f"\nVERSION {group.version} - {date_str}")
+            write("\n" + "-" * 70 + "\n")
             
-            for category in Category:
-                if category in group.commits_by_category:
-                    lines.append(f"{category.value.upper()}:")
-                    for commit in group.commits_by_category[category]:
-                        message = self._clean_commit_message(commit.message)
-                        lines.append(f"  * {message}")
-                    lines.append("")
+            for category, commits in group.commits_by_category.items():
+                write(f"\n{category.value.upper()}:")
+                for commit in commits:
+                    message = self._clean_commit_message(commit.message)
+                    write(f"\n  * {message}")
+                write("\n")
             
-            lines.append("")
-        
-        return '\n'.join(lines)
+            write("\n")
+    
+    def _format_date(self, date: Optional[datetime]) -> str:
+        """Format a version date; the default ISO format skips strftime."""
+        if date is None:
+            return "Unknown"
+        if self.date_format == "%Y-%m-%d":
+            return f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
+        return date.strftime(self.date_format)
     
     def _clean_commit_message(self, message: str) -> str:
         """Clean commit message (remove conventional commit prefixes)."""
-        # Remove conventional commit prefix (feat:, fix:, etc.)
-        message = re.sub(r'^(feat|fix|docs|style|refactor|perf|test|chore|build|ci)(\(.+?\))?:\s*', '', message)
+        # Remove conventional commit prefix (feat:, fix:, etc.); the startswith
+        # check skips the regex for messages that can't have one
+        if message.startswith(CONVENTIONAL_TYPES):
+            message = CONVENTIONAL_PREFIX_RE.sub('', message)
         # Capitalize first letter
         if message:
             message = message[0].upper() + message[1:]
         return message
 
 
+# Output format name -> ChangelogFormatter method producing it
+FORMATTERS = {
+    'markdown': ChangelogFormatter.format_markdown,
+    'json': ChangelogFormatter.format_json,
+    'text': ChangelogFormatter.format_text,
+}
+
+
 # ═══════════════════════════════════════════════════════════════════
 # COMPONENT 5: OUTPUT WRITER
 # ═══════════════════════════════════════════════════════════════════
@@ -578,16 +938,15 @@ class OutputWriter:
         if path.exists() and self.backup_enabled:
             self._backup_file(path)
         
-        # Atomic write (write to temp, then rename)
+        # Atomic write (write to temp in the same directory, then replace)
         temp_path = path.with_suffix('.tmp')
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Encode once and write the bytes in a single call; this also keeps
+            # LF line endings on every platform
+            temp_path.write_bytes(content.encode('utf-8'))
             
-            # Rename temp to target (atomic on POSIX, best-effort on Windows)
-            if path.exists():
-                path.unlink()
-            temp_path.rename(path)
+            # os.replace overwrites atomically on both POSIX and Windows
+            os.replace(temp_path, path)
             
         except Exception as e:
             # Clean up temp file
@@ -620,7 +979,9 @@ class ChangeLog:
                 format: str = 'markdown',
                 backup: bool = True,
                 since_date: Optional[datetime] = None,
-                until_date: Optional[datetime] = None) -> str:
+                until_date: Optional[datetime] = None,
+                workers: int = 1,
+                categories: Optional[Iterable[Category]] = None) -> str:
         """
         Generate changelog for a git repository.
         
@@ -631,6 +992,8 @@ class ChangeLog:
             backup: Create backup before overwriting (default: True)
             since_date: Include commits since this date
             until_date: Include commits until this date
+            workers: Processes used to categorize commits (0 = one per CPU)
+            categories: Only include commits in these categories (default: all)
             
         Returns:
             Formatted changelog string
@@ -639,34 +1002,79 @@ class ChangeLog:
             ValueError: If invalid repository or parameters
             RuntimeError: If generation fails
         """
-        # Parse commits
-        parser = GitLogParser(Path(repo_path))
-        commits = parser.parse_commits(since_date, until_date)
+        from concurrent.futures import ThreadPoolExecutor
         
-        if not commits:
-            raise ValueError("No commits found in repository")
+        # Reject an unknown format before doing any git work
+        try:
+            format_changelog = FORMATTERS[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {format}")
         
+        parser = GitLogParser(Path(repo_path))
         tags = parser.parse_tags()
         
-        # Categorize commits
-        categorizer = CommitCategorizer()
-        categorized = categorizer.categorize_batch(commits)
-        
-        # Group by version
-        grouper = VersionGrouper()
-        grouper.repo_path = parser.repo_path  # For commit range queries
-        groups = grouper.group_by_version(categorized, tags)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The tag-range walk is a separate git process; it runs in the
+            # background while this thread parses and categorizes the commit log.
+            # Not with worker processes: forking while another thread runs can
+            # deadlock the child, and the executor only starts its thread here.
+            ranges_future = None
+            if tags and workers == 1:
+                ranges_future = executor.submit(parser.parse_tag_ranges)
+            
+            categorizer = CommitCategorizer()
+            
+            # Let git drop commits that mention none of the wanted keywords. This
+            # is only a pre-filter: git also searches message bodies and matches
+            # mid-word, so the real category check happens after categorizing.
+            # Changed is the fallback category and can't be pre-filtered.
+            wanted = set(categories) if categories is not None else None
+            grep = None
+            if wanted is not None and Category.CHANGED not in wanted:
+                grep = [
+                    keyword
+                    for category, keywords in categorizer.categories.items()
+                    if category in wanted
+                    for keyword in keywords
+                ] or None
+            
+            # Parse commits lazily; the git log pipe buffers ahead of the consumer
+            commits = parser.iter_commits(since_date, until_date, grep)
+            
+            # Categorize commits (worker processes need the full list up front)
+            if workers == 1:
+                categorized = categorizer.iter_categorized(commits)
+            else:
+                categorized = categorizer.categorize_batch(list(commits), workers)
+            
+            if wanted is not None:
+                categorized = (commit for commit in categorized if commit.category in wanted)
+            
+            # Checked after the category filter, which can drop everything the
+            # git pre-filter let through
+            categorized = iter(categorized)
+            first = next(categorized, None)
+            if first is None:
+                if wanted is not None:
+                    raise ValueError("No commits found in the selected categories")
+                raise ValueError("No commits found in repository")
+            categorized = chain([first], categorized)
+            
+            # Grouping needs the ranges up front; without tags there are none
+            tag_ranges = None
+            if tags:
+                categorized = list(categorized)
+                if ranges_future is not None:
+                    tag_ranges = ranges_future.result()
+                else:
+                    tag_ranges = parser.parse_tag_ranges()
+            
+            # Group by version
+            grouper = VersionGrouper()
+            groups = grouper.group_by_version(categorized, tags, tag_ranges)
         
         # Format output
-        formatter = ChangelogFormatter()
-        if format == 'markdown':
-            content = formatter.format_markdown(groups)
-        elif format == 'json':
-            content = formatter.format_json(groups)
-        elif format == 'text':
-            content = formatter.format_text(groups)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        content = format_changelog(ChangelogFormatter(), groups)
         
         # Write to file
         if output_path is None:
@@ -683,8 +1091,49 @@ class ChangeLog:
 # CLI INTERFACE
 # ═══════════════════════════════════════════════════════════════════
 
+def _parse_categories(value: str) -> List[Category]:
+    """Parse a comma-separated list of category names (case-insensitive)."""
+    import argparse
+    
+    by_name = {category.value.lower(): category for category in Category}
+    categories = []
+    for name in value.split(','):
+        name = name.strip().lower()
+        if name not in by_name:
+            choices = ', '.join(category.value for category in Category)
+            raise argparse.ArgumentTypeError(
+                f"unknown category '{name}' (choose from {choices})")
+        categories.append(by_name[name])
+    return categories
+
+
+def _parse_workers(value: str) -> int:
+    """Parse a worker count (0 = one per CPU) for argparse."""
+    import argparse
+    
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = -1
+    if workers < 0:
+        raise argparse.ArgumentTypeError(f"invalid worker count '{value}' (expected 0 or more)")
+    return workers
+
+
+def _parse_date(value: str) -> datetime:
+    """Parse an ISO date (YYYY-MM-DD, optionally with a time) for argparse."""
+    import argparse
+    
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+
+
 def main():
     """CLI entry point."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='ChangeLog - Automated CHANGELOG.md Generator',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -694,6 +1143,7 @@ Examples:
   changelog generate /path/to/repo     # Generate for specific repo
   changelog generate --format json     # Output as JSON
   changelog generate --no-backup       # Don't backup existing file
+  changelog generate --only Fixed      # Only list bug fixes
 
 For more information: https://github.com/DonkRonk17/ChangeLog
         """
@@ -703,33 +1153,35 @@ For more information: https://github.com/DonkRonk17/ChangeLog
                        help='Command to execute')
     parser.add_argument('repo_path', nargs='?', default='.',
                        help='Path to git repository (default: current directory)')
-    parser.add_argument('--format', choices=['markdown', 'json', 'text'],
+    parser.add_argument('--format', choices=list(FORMATTERS),
                        default='markdown', help='Output format (default: markdown)')
     parser.add_argument('--output', type=str,
                        help='Output file path (default: CHANGELOG.md)')
     parser.add_argument('--no-backup', action='store_true',
                        help='Skip backup of existing CHANGELOG.md')
-    parser.add_argument('--since', type=str,
+    parser.add_argument('--since', type=_parse_date,
                        help='Include commits since date (YYYY-MM-DD)')
-    parser.add_argument('--until', type=str,
+    parser.add_argument('--until', type=_parse_date,
                        help='Include commits until date (YYYY-MM-DD)')
+    parser.add_argument('--only', type=_parse_categories, metavar='CATEGORIES',
+                       help='Only include these categories, comma-separated (e.g. Fixed,Added)')
+    parser.add_argument('-n', '--numprocesses', type=_parse_workers, default=1,
+                       help='Worker processes for categorization (0 = one per CPU, default: 1)')
     parser.add_argument('--version', action='version',
                        version='%(prog)s 1.0.0')
     
     args = parser.parse_args()
     
-    # Parse dates
-    since_date = datetime.fromisoformat(args.since) if args.since else None
-    until_date = datetime.fromisoformat(args.until) if args.until else None
-    
     try:
         ChangeLog.generate(
             repo_path=args.repo_path,
             output_path=args.output,
             format=args.format,
             backup=not args.no_backup,
-            since_date=since_date,
-            until_date=until_date
+            since_date=args.since,
+            until_date=args.until,
+            workers=args.numprocesses,
+            categories=args.only
         )
     except (ValueError, EnvironmentError, RuntimeError) as e:
         print(f"[X] Error: {e}", file=sys.stderr)
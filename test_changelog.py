@@ -10,16 +10,21 @@ Tests cover:
 - OutputWriter: File writing, backup, atomic operations
 - Integration: End-to-end changelog generation
 
-Run: python test_changelog.py
+Run: python test_changelog.py [--serial] [--only=TestClassName]
+     (set CHANGELOG_TESTS_FAST=1 to report failures only)
 """
 
+import gc
+import io
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
 import unittest
+import weakref
 from datetime import datetime
 from pathlib import Path
 
@@ -30,16 +35,110 @@ from changelog import (
     Category,
     ChangeLog,
     ChangelogFormatter,
+    CONVENTIONAL_PREFIX_RE,
     Commit,
     CommitCategorizer,
     GitLogParser,
     OutputWriter,
+    PARALLEL_MIN_COMMITS,
     Tag,
     VersionGroup,
     VersionGrouper
 )
 
 
+# Fixed timestamp for commits whose date doesn't matter to the test
+_NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+# Fixture commits get their identity from -c flags, so test repositories
+# need no git config calls (and never wait on commit signing). Durability
+# syncs and auto-gc are pointless for them too.
+GIT = ['git', '-c', 'user.name=Test User', '-c', 'user.email=test@example.com',
+       '-c', 'commit.gpgsign=false', '-c', 'tag.gpgsign=false',
+       '-c', 'core.fsync=none', '-c', 'gc.auto=0']
+
+
+_module_tempdir = None
+_saved_tempdir = None
+
+
+def setUpModule():
+    """Create one parent directory that every test's temp dirs go under."""
+    global _module_tempdir, _saved_tempdir
+    # Fixture repositories are throwaway: keep them in RAM where tmpfs is available
+    shm = None
+    if sys.platform.startswith('linux') and os.access('/dev/shm', os.W_OK):
+        shm = '/dev/shm'
+    _module_tempdir = tempfile.mkdtemp(prefix='changelog_tests_', dir=shm)
+    _saved_tempdir = tempfile.tempdir
+    tempfile.tempdir = _module_tempdir
+
+
+def tearDownModule():
+    """Remove every test temp dir with a single recursive delete."""
+    tempfile.tempdir = _saved_tempdir
+    shutil.rmtree(_module_tempdir, ignore_errors=True)
+
+
+def git(repo_path, *args):
+    """Run a git command inside a fixture repository (output discarded)."""
+    subprocess.run(GIT + list(args), cwd=repo_path, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def link_or_copy(src, dst):
+    """
+    copytree copy_function: hardlink git objects, copy everything else.
+    
+    Object files are immutable once written, so copies may share them.
+    Files git rewrites in place (reflogs, COMMIT_EDITMSG) must stay private.
+    """
+    if f'{os.sep}objects{os.sep}' in src:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass  # Different filesystem or no hardlink support
+    return shutil.copy2(src, dst)
+
+
+def git_fast_import(repo_path, commits):
+    """
+    Create a chain of commits on the current branch with one git process.
+    
+    Args:
+        repo_path: Initialized repository to write into
+        commits: (file name, file content, message) tuples, oldest first
+    """
+    # 'ref: refs/heads/<branch>' - honors whatever init.defaultBranch is set
+    branch = (Path(repo_path) / '.git' / 'HEAD').read_text().split(': ', 1)[1].strip()
+    stream = []
+    for i, (name, content, message) in enumerate(commits):
+        content = content.encode('utf-8')
+        message = message.encode('utf-8')
+        stream.append(
+            b'commit %s\n'
+            b'committer Test User <test@example.com> %d +0000\n'
+            b'data %d\n%s\n'
+            b'M 100644 inline %s\n'
+            b'data %d\n%s\n'
+            % (branch.encode(), 1700000000 + i, len(message), message,
+               name.encode('utf-8'), len(content), content)
+        )
+    subprocess.run(GIT + ['fast-import', '--quiet'], cwd=repo_path, check=True,
+                   input=b''.join(stream), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+class ChangelogTestCase(unittest.TestCase):
+    """TestCase with assertions for checking generated changelog text."""
+    
+    def assertAllIn(self, needles, haystack):
+        """Assert every needle occurs in haystack, reporting all missing ones."""
+        missing = [needle for needle in needles if needle not in haystack]
+        if missing:
+            self.fail(f"Missing from output: {missing!r}")
+
+
 # ═══════════════════════════════════════════════════════════════════
 # TEST: GIT LOG PARSER
 # ═══════════════════════════════════════════════════════════════════
@@ -47,24 +146,33 @@ from changelog import (
 class TestGitLogParser(unittest.TestCase):
     """Test git log parsing functionality."""
     
-    def setUp(self):
-        """Create temporary git repository for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.repo_path = Path(self.temp_dir)
+    priority = 3  # Slowest class: runs git for its fixture and several tests
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the template git repository once for the class."""
+        cls.template_dir = tempfile.mkdtemp()
+        cls.template_path = Path(cls.template_dir) / 'repo'
+        cls.template_path.mkdir()
         
         # Initialize git repo
-        subprocess.run(['git', 'init'], cwd=self.repo_path, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=self.repo_path, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=self.repo_path, check=True, capture_output=True)
+        git(cls.template_path, 'init')
         
         # Create initial commit
-        (self.repo_path / 'README.md').write_text('# Test Repo')
-        subprocess.run(['git', 'add', 'README.md'], cwd=self.repo_path, check=True, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', 'Initial commit'], cwd=self.repo_path, check=True, capture_output=True)
+        (cls.template_path / 'README.md').write_text('# Test Repo')
+        git(cls.template_path, 'add', 'README.md')
+        git(cls.template_path, 'commit', '-m', 'Initial commit')
+    
+    def setUp(self):
+        """Point at the shared template; tests that write call make_writable()."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo_path = self.template_path
     
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    def make_writable(self):
+        """Switch this test to its own copy of the template repository."""
+        self.repo_path = Path(self.temp_dir) / 'repo'
+        shutil.copytree(self.template_path, self.repo_path, symlinks=True,
+                        copy_function=link_or_copy)
     
     def test_initialization_valid_repo(self):
         """Test: Initialize parser with valid git repository."""
@@ -77,6 +185,12 @@ class TestGitLogParser(unittest.TestCase):
         with self.assertRaises(ValueError):
             GitLogParser(invalid_path)
     
+    def test_parse_commits_not_a_repo(self):
+        """Test: Parsing a directory that is not a git repository raises ValueError."""
+        parser = GitLogParser(self.temp_dir)
+        with self.assertRaises(ValueError):
+            parser.parse_commits()
+    
     def test_parse_commits_basic(self):
         """Test: Parse commits from repository."""
         parser = GitLogParser(self.repo_path)
@@ -85,14 +199,25 @@ class TestGitLogParser(unittest.TestCase):
         self.assertGreater(len(commits), 0)
         self.assertIsInstance(commits[0], Commit)
         self.assertEqual(commits[0].message, 'Initial commit')
+
+    def test_parse_commits_pipe_in_fields(self):
+        """Test: Author names and messages containing '|' parse intact."""
+        self.make_writable()
+        (self.repo_path / 'file.txt').write_text('content')
+        git(self.repo_path, 'add', 'file.txt')
+        git(self.repo_path, '-c', 'user.name=Ann | Bob', 'commit', '-m', 'fix: a | b')
+
+        commit = GitLogParser(self.repo_path).parse_commits()[0]
+
+        self.assertEqual(commit.author, 'Ann | Bob')
+        self.assertEqual(commit.email, 'test@example.com')
+        self.assertEqual(commit.message, 'fix: a | b')
     
     def test_parse_commits_empty_repo(self):
         """Test: Parse commits from repository with no commits returns empty list."""
         # Create empty git repo
         empty_dir = tempfile.mkdtemp()
-        subprocess.run(['git', 'init'], cwd=empty_dir, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=empty_dir, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=empty_dir, check=True, capture_output=True)
+        git(empty_dir, 'init')
         
         parser = GitLogParser(empty_dir)
         
@@ -105,13 +230,12 @@ class TestGitLogParser(unittest.TestCase):
         except RuntimeError as e:
             # Expected: git log fails on empty repo
             self.assertIn("does not have any commits", str(e))
-        
-        shutil.rmtree(empty_dir, ignore_errors=True)
     
     def test_parse_tags(self):
         """Test: Parse version tags from repository."""
+        self.make_writable()
         # Create tag
-        subprocess.run(['git', 'tag', 'v1.0.0'], cwd=self.repo_path, check=True, capture_output=True)
+        git(self.repo_path, 'tag', 'v1.0.0')
         
         parser = GitLogParser(self.repo_path)
         tags = parser.parse_tags()
@@ -120,6 +244,79 @@ class TestGitLogParser(unittest.TestCase):
         self.assertIsInstance(tags[0], Tag)
         self.assertEqual(tags[0].name, 'v1.0.0')
     
+    def test_parse_tag_ranges(self):
+        """Test: Commits are assigned to the tag that releases them."""
+        self.make_writable()
+        git(self.repo_path, 'tag', 'v1.0.0')
+        (self.repo_path / 'CHANGES.md').write_text('unreleased')
+        git(self.repo_path, 'add', 'CHANGES.md')
+        git(self.repo_path, 'commit', '-m', 'Unreleased work')
+        
+        parser = GitLogParser(self.repo_path)
+        commits = parser.parse_commits()
+        ranges = parser.parse_tag_ranges()
+        
+        self.assertEqual(ranges, {'v1.0.0': [commits[1].hash]})
+    
+    def test_parse_tag_ranges_merged_branch(self):
+        """Test: Mainline commits belong to the release that merges a tagged branch."""
+        self.make_writable()
+        git(self.repo_path, 'checkout', '-b', 'release')
+        git(self.repo_path, 'commit', '--allow-empty', '-m', 'B')
+        git(self.repo_path, 'commit', '--allow-empty', '-m', 'C')
+        git(self.repo_path, 'tag', 'v1.0.0')
+        git(self.repo_path, 'checkout', '-')
+        git(self.repo_path, 'commit', '--allow-empty', '-m', 'S1')
+        git(self.repo_path, 'commit', '--allow-empty', '-m', 'S2')
+        git(self.repo_path, 'merge', '--no-ff', '-m', 'Merge release', 'release')
+        git(self.repo_path, 'tag', 'v2.0.0')
+        
+        parser = GitLogParser(self.repo_path)
+        hashes = {c.message: c.hash for c in parser.parse_commits()}
+        ranges = parser.parse_tag_ranges()
+        
+        self.assertEqual(set(ranges['v1.0.0']),
+                         {hashes['Initial commit'], hashes['B'], hashes['C']})
+        self.assertIn(hashes['S1'], ranges['v2.0.0'])
+        self.assertIn(hashes['S2'], ranges['v2.0.0'])
+        self.assertNotIn(hashes['C'], ranges['v2.0.0'])
+    
+    def test_parse_tag_ranges_divergent_branches(self):
+        """Test: A commit on two release branches belongs to the lower version."""
+        self.make_writable()
+        git(self.repo_path, 'commit', '--allow-empty', '-m', 'Shared')
+        git(self.repo_path, 'checkout', '-b', 'maint-1.0')
+        git(self.repo_path, 'commit', '--allow-empty', '-m', 'P')
+        git(self.repo_path, 'tag', 'v1.0.0')
+        git(self.repo_path, 'checkout', '-')
+        git(self.repo_path, 'commit', '--allow-empty', '-m', 'Q')
+        git(self.repo_path, 'tag', 'v1.1.0')
+        
+        parser = GitLogParser(self.repo_path)
+        hashes = {c.message: c.hash for c in parser.parse_commits()}  # main only
+        ranges = parser.parse_tag_ranges()
+        
+        # v1.0.0: Initial commit, Shared, P; v1.1.0 only adds Q
+        self.assertEqual(ranges['v1.1.0'], [hashes['Q']])
+        self.assertEqual(len(ranges['v1.0.0']), 3)
+        self.assertIn(hashes['Shared'], ranges['v1.0.0'])
+        self.assertIn(hashes['Initial commit'], ranges['v1.0.0'])
+    
+    def test_parse_tag_ranges_shared_commit(self):
+        """Test: Tags on the same commit each get that commit's range."""
+        self.make_writable()
+        git(self.repo_path, 'tag', 'v1.0.0')
+        git(self.repo_path, 'tag', 'v1.0.1')
+        
+        parser = GitLogParser(self.repo_path)
+        ranges = parser.parse_tag_ranges()
+        groups = VersionGrouper().group_by_version(
+            CommitCategorizer().iter_categorized(parser.iter_commits()),
+            parser.parse_tags(), ranges)
+        
+        self.assertEqual(ranges['v1.0.0'], ranges['v1.0.1'])
+        self.assertEqual([g.version for g in groups], ['1.0.1', '1.0.0'])
+    
     def test_parse_tags_no_tags(self):
         """Test: Parse tags from repository with no tags."""
         parser = GitLogParser(self.repo_path)
@@ -127,6 +324,16 @@ class TestGitLogParser(unittest.TestCase):
         
         self.assertEqual(len(tags), 0)
 
+    def test_parse_tags_cached(self):
+        """Test: Tags are read from git once per parser instance."""
+        self.make_writable()
+        parser = GitLogParser(self.repo_path)
+        tags = parser.parse_tags()
+        git(self.repo_path, 'tag', 'v1.0.0')
+
+        self.assertIs(parser.parse_tags(), tags)
+        self.assertEqual(len(GitLogParser(self.repo_path).parse_tags()), 1)
+
 
 # ═══════════════════════════════════════════════════════════════════
 # TEST: COMMIT CATEGORIZER
@@ -135,89 +342,116 @@ class TestGitLogParser(unittest.TestCase):
 class TestCommitCategorizer(unittest.TestCase):
     """Test commit categorization functionality."""
     
-    def setUp(self):
-        """Set up categorizer for testing."""
-        self.categorizer = CommitCategorizer()
-    
-    def test_categorize_feat_conventional(self):
-        """Test: Categorize conventional commit 'feat:'."""
-        commit = Commit(
-            hash='abc123',
-            author='Test User',
-            email='test@example.com',
-            date=datetime.now(),
-            message='feat: Add new feature'
-        )
-        
-        categorized = self.categorizer.categorize_commit(commit)
-        self.assertEqual(categorized.category, Category.ADDED)
-    
-    def test_categorize_fix_conventional(self):
-        """Test: Categorize conventional commit 'fix:'."""
-        commit = Commit(
-            hash='def456',
-            author='Test User',
-            email='test@example.com',
-            date=datetime.now(),
-            message='fix: Resolve bug in parser'
-        )
-        
-        categorized = self.categorizer.categorize_commit(commit)
-        self.assertEqual(categorized.category, Category.FIXED)
-    
-    def test_categorize_keyword_add(self):
-        """Test: Categorize using keyword 'add'."""
-        commit = Commit(
-            hash='ghi789',
-            author='Test User',
-            email='test@example.com',
-            date=datetime.now(),
-            message='Add new configuration option'
-        )
-        
-        categorized = self.categorizer.categorize_commit(commit)
-        self.assertEqual(categorized.category, Category.ADDED)
-    
-    def test_categorize_keyword_remove(self):
-        """Test: Categorize using keyword 'delete' (removed)."""
-        commit = Commit(
-            hash='jkl012',
-            author='Test User',
-            email='test@example.com',
-            date=datetime.now(),
-            message='Delete old configuration'
-        )
-        
-        categorized = self.categorizer.categorize_commit(commit)
-        self.assertEqual(categorized.category, Category.REMOVED)
-    
-    def test_categorize_default_changed(self):
-        """Test: Default categorization to CHANGED."""
-        commit = Commit(
-            hash='mno345',
-            author='Test User',
-            email='test@example.com',
-            date=datetime.now(),
-            message='Update README documentation'
-        )
-        
-        categorized = self.categorizer.categorize_commit(commit)
-        self.assertEqual(categorized.category, Category.CHANGED)
+    priority = 2  # Starts a process pool in test_categorize_batch_parallel
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up categorizer for testing (stateless, so shared by all tests)."""
+        cls.categorizer = CommitCategorizer()
+    
+    def test_categorize_matrix(self):
+        """Test: Conventional prefixes, keywords and the CHANGED default."""
+        cases = [
+            ('feat: Add new feature', Category.ADDED),          # conventional 'feat:'
+            ('fix: Resolve bug in parser', Category.FIXED),     # conventional 'fix:'
+            ('Add new configuration option', Category.ADDED),   # keyword 'add'
+            ('Delete old configuration', Category.REMOVED),     # keyword 'delete'
+            ('Update README documentation', Category.CHANGED),  # keyword 'update'
+            ('Bump version to 2.0', Category.CHANGED),          # no keyword: default
+        ]
+        for message, expected in cases:
+            with self.subTest(message=message):
+                commit = Commit('abc123', 'Test User', 'test@example.com', _NOW, message)
+                categorized = self.categorizer.categorize_commit(commit)
+                self.assertEqual(categorized.category, expected)
     
     def test_categorize_batch(self):
-        """Test: Batch categorization of multiple commits."""
-        commits = [
-            Commit('a1', 'User', 'e@e.com', datetime.now(), 'feat: Feature 1'),
-            Commit('a2', 'User', 'e@e.com', datetime.now(), 'fix: Bug 1'),
-            Commit('a3', 'User', 'e@e.com', datetime.now(), 'Update something'),
-        ]
+        """Test: Batch categorization of a stream of commits."""
+        def commits():
+            yield Commit('a1', 'User', 'e@e.com', _NOW, 'feat: Feature 1')
+            yield Commit('a2', 'User', 'e@e.com', _NOW, 'fix: Bug 1')
+            yield Commit('a3', 'User', 'e@e.com', _NOW, 'Update something')
         
-        categorized = self.categorizer.categorize_batch(commits)
+        categorized = self.categorizer.categorize_batch(commits())
         
         self.assertEqual(len(categorized), 3)
         self.assertEqual(categorized[0].category, Category.ADDED)
         self.assertEqual(categorized[1].category, Category.FIXED)
         self.assertEqual(categorized[2].category, Category.CHANGED)
+    
+    def test_categorize_batch_parallel(self):
+        """Test: Parallel batch categorization matches sequential order and result."""
+        messages = ['feat: Feature', 'fix: Bug', 'Update something', 'Remove old code']
+        commits = [
+            Commit(f'h{i}', 'User', 'e@e.com', _NOW, messages[i % len(messages)])
+            for i in range(PARALLEL_MIN_COMMITS + 1)
+        ]
+        
+        sequential = self.categorizer.categorize_batch(commits)
+        parallel = self.categorizer.categorize_batch(commits, workers=2)
+        
+        self.assertEqual([c.hash for c in parallel], [c.hash for c in sequential])
+        self.assertEqual([c.category for c in parallel], [c.category for c in sequential])
+
+    def test_categorize_batch_negative_workers(self):
+        """Test: A negative worker count is rejected."""
+        with self.assertRaises(ValueError):
+            self.categorizer.categorize_batch([], workers=-3)
+
+    def test_keyword_pattern_shared(self):
+        """Test: Categorizers with the same config reuse one compiled pattern."""
+        other = CommitCategorizer()
+        self.assertIs(other._keyword_re, self.categorizer._keyword_re)
+
+    def test_categorize_is_cached(self):
+        """Test: With cache_size set, repeated messages are classified once."""
+        categorizer = CommitCategorizer(cache_size=16)
+        for i in range(3):
+            commit = Commit(f'a{i}', 'User', 'e@e.com', _NOW, 'fix: typo')
+            self.assertEqual(categorizer.categorize_commit(commit).category, Category.FIXED)
+        
+        info = categorizer._classify.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+    
+    def test_categorizer_not_in_reference_cycle(self):
+        """Test: A categorizer (cached or not) is freed as soon as it is dropped."""
+        for cache_size in (0, 16):
+            with self.subTest(cache_size=cache_size):
+                categorizer = CommitCategorizer(cache_size=cache_size)
+                categorizer.categorize_commit(Commit('a', 'User', 'e@e.com', _NOW, 'fix: typo'))
+                ref = weakref.ref(categorizer)
+                gc.disable()
+                try:
+                    del categorizer
+                    self.assertIsNone(ref())
+                finally:
+                    gc.enable()
+
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_commit_has_slots(self):
+        """Test: Commit instances carry no per-instance __dict__."""
+        commit = Commit('abc123', 'Test User', 'test@example.com', _NOW, 'feat: Feature')
+        self.assertTrue(hasattr(Commit, '__slots__'))
+        self.assertFalse(hasattr(commit, '__dict__'))
+
+    def test_patterns_are_precompiled(self):
+        """Test: Hot-path patterns are compiled once, not per message."""
+        self.assertIsInstance(CONVENTIONAL_PREFIX_RE, re.Pattern)
+        self.assertIsInstance(self.categorizer._keyword_re, re.Pattern)
+
+    def test_iter_categorized(self):
+        """Test: Lazy categorization accepts a generator and preserves order."""
+        messages = ['feat: Feature 1', 'fix: Bug 1', 'Update something']
+        commits = (
+            Commit(f'a{i}', 'User', 'e@e.com', _NOW, message)
+            for i, message in enumerate(messages)
+        )
+
+        categorized = list(self.categorizer.iter_categorized(commits))
+
+        self.assertEqual([c.hash for c in categorized], ['a0', 'a1', 'a2'])
+        self.assertEqual([c.category for c in categorized],
+                         [Category.ADDED, Category.FIXED, Category.CHANGED])
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -227,17 +461,18 @@ class TestCommitCategorizer(unittest.TestCase):
 class TestVersionGrouper(unittest.TestCase):
     """Test version grouping functionality."""
     
-    def setUp(self):
-        """Set up grouper for testing."""
-        self.grouper = VersionGrouper()
+    @classmethod
+    def setUpClass(cls):
+        """Set up grouper for testing (stateless, so shared by all tests)."""
+        cls.grouper = VersionGrouper()
     
     def test_group_no_tags_unreleased(self):
         """Test: Group all commits as Unreleased when no tags."""
         from changelog import CategorizedCommit
         
         commits = [
-            CategorizedCommit('a1', 'User', 'e@e.com', datetime.now(), 'feat: Feature 1', Category.ADDED),
-            CategorizedCommit('a2', 'User', 'e@e.com', datetime.now(), 'fix: Bug 1', Category.FIXED),
+            CategorizedCommit('a1', 'User', 'e@e.com', _NOW, 'feat: Feature 1', Category.ADDED),
+            CategorizedCommit('a2', 'User', 'e@e.com', _NOW, 'fix: Bug 1', Category.FIXED),
         ]
         
         groups = self.grouper.group_by_version(commits, [])
@@ -267,6 +502,24 @@ class TestVersionGrouper(unittest.TestCase):
         # Should have at least the tagged version
         self.assertGreaterEqual(len(groups), 1)
     
+    def test_group_with_tag_ranges(self):
+        """Test: Group commits using exact tag ranges instead of dates."""
+        from changelog import CategorizedCommit
+        
+        date = datetime(2026, 1, 1)
+        commits = [
+            CategorizedCommit('a3', 'User', 'e@e.com', date, 'Update docs', Category.CHANGED),
+            CategorizedCommit('a2', 'User', 'e@e.com', date, 'fix: Bug 1', Category.FIXED),
+            CategorizedCommit('a1', 'User', 'e@e.com', date, 'feat: Feature 1', Category.ADDED),
+        ]
+        tags = [Tag('v1.1.0', 'a2', date), Tag('v1.0.0', 'a1', date)]
+        ranges = {'v1.1.0': ['a2'], 'v1.0.0': ['a1']}
+        
+        groups = self.grouper.group_by_version(commits, tags, ranges)
+        
+        self.assertEqual([g.version for g in groups], ['Unreleased', '1.1.0', '1.0.0'])
+        self.assertEqual(groups[1].commits_by_category, {Category.FIXED: [commits[1]]})
+    
     def test_parse_version_with_v_prefix(self):
         """Test: Parse version with 'v' prefix."""
         version = self.grouper._parse_version('v1.2.3')
@@ -282,19 +535,20 @@ class TestVersionGrouper(unittest.TestCase):
 # TEST: CHANGELOG FORMATTER
 # ═══════════════════════════════════════════════════════════════════
 
-class TestChangelogFormatter(unittest.TestCase):
+class TestChangelogFormatter(ChangelogTestCase):
     """Test changelog formatting."""
     
-    def setUp(self):
-        """Set up formatter for testing."""
-        self.formatter = ChangelogFormatter()
+    @classmethod
+    def setUpClass(cls):
+        """Set up formatter for testing (stateless, so shared by all tests)."""
+        cls.formatter = ChangelogFormatter()
     
     def test_format_markdown_basic(self):
         """Test: Format basic changelog as Markdown."""
         from changelog import CategorizedCommit
         
         commits = [
-            CategorizedCommit('a1', 'User', 'e@e.com', datetime.now(), 'feat: Feature 1', Category.ADDED)
+            CategorizedCommit('a1', 'User', 'e@e.com', _NOW, 'feat: Feature 1', Category.ADDED)
         ]
         
         group = VersionGroup(
@@ -305,17 +559,15 @@ class TestChangelogFormatter(unittest.TestCase):
         
         markdown = self.formatter.format_markdown([group])
         
-        self.assertIn('# Changelog', markdown)
-        self.assertIn('## [1.0.0] - 2026-02-10', markdown)
-        self.assertIn('### Added', markdown)
-        self.assertIn('Feature 1', markdown)
+        self.assertAllIn(['# Changelog', '## [1.0.0] - 2026-02-10', '### Added', 'Feature 1'],
+                         markdown)
     
     def test_format_json_basic(self):
         """Test: Format basic changelog as JSON."""
         from changelog import CategorizedCommit
         
         commits = [
-            CategorizedCommit('a1', 'User', 'e@e.com', datetime.now(), 'feat: Feature 1', Category.ADDED)
+            CategorizedCommit('a1', 'User', 'e@e.com', _NOW, 'feat: Feature 1', Category.ADDED)
         ]
         
         group = VersionGroup(
@@ -336,7 +588,7 @@ class TestChangelogFormatter(unittest.TestCase):
         from changelog import CategorizedCommit
         
         commits = [
-            CategorizedCommit('a1', 'User', 'e@e.com', datetime.now(), 'feat: Feature 1', Category.ADDED)
+            CategorizedCommit('a1', 'User', 'e@e.com', _NOW, 'feat: Feature 1', Category.ADDED)
         ]
         
         group = VersionGroup(
@@ -347,10 +599,7 @@ class TestChangelogFormatter(unittest.TestCase):
         
         text = self.formatter.format_text([group])
         
-        self.assertIn('CHANGELOG', text)
-        self.assertIn('VERSION 1.0.0', text)
-        self.assertIn('ADDED:', text)
-        self.assertIn('Feature 1', text)
+        self.assertAllIn(['CHANGELOG', 'VERSION 1.0.0', 'ADDED:', 'Feature 1'], text)
     
     def test_clean_commit_message(self):
         """Test: Clean conventional commit prefixes."""
@@ -374,10 +623,6 @@ class TestOutputWriter(unittest.TestCase):
         self.temp_path = Path(self.temp_dir)
         self.writer = OutputWriter()
     
-    def tearDown(self):
-        """Clean up temp directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_write_changelog_new_file(self):
         """Test: Write changelog to new file."""
         output_path = self.temp_path / 'CHANGELOG.md'
@@ -408,35 +653,35 @@ class TestOutputWriter(unittest.TestCase):
 # TEST: INTEGRATION
 # ═══════════════════════════════════════════════════════════════════
 
-class TestIntegration(unittest.TestCase):
+class TestIntegration(ChangelogTestCase):
     """Test end-to-end changelog generation."""
     
-    def setUp(self):
-        """Create test git repository."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.repo_path = Path(self.temp_dir)
+    priority = 1  # Runs git for its fixture and in every test
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the template git repository once for the class."""
+        cls.template_dir = tempfile.mkdtemp()
+        cls.template_path = Path(cls.template_dir) / 'repo'
+        cls.template_path.mkdir()
         
         # Initialize git repo
-        subprocess.run(['git', 'init'], cwd=self.repo_path, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=self.repo_path, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=self.repo_path, check=True, capture_output=True)
+        git(cls.template_path, 'init')
         
-        # Create commits
-        (self.repo_path / 'file1.txt').write_text('Content 1')
-        subprocess.run(['git', 'add', '.'], cwd=self.repo_path, check=True, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', 'feat: Add feature 1'], cwd=self.repo_path, check=True, capture_output=True)
-        
-        (self.repo_path / 'file2.txt').write_text('Content 2')
-        subprocess.run(['git', 'add', '.'], cwd=self.repo_path, check=True, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', 'fix: Fix bug 1'], cwd=self.repo_path, check=True, capture_output=True)
+        # Create commits (history only; the tests never read the work tree)
+        git_fast_import(cls.template_path, [
+            ('file1.txt', 'Content 1', 'feat: Add feature 1'),
+            ('file2.txt', 'Content 2', 'fix: Fix bug 1'),
+        ])
     
-    def tearDown(self):
-        """Clean up test repository."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    def setUp(self):
+        """Read the shared template repository; write output to a temp dir."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo_path = self.template_path
     
     def test_generate_changelog_full_pipeline(self):
         """Test: Full pipeline from git repo to CHANGELOG.md."""
-        output_path = self.repo_path / 'CHANGELOG.md'
+        output_path = Path(self.temp_dir) / 'CHANGELOG.md'
         
         changelog = ChangeLog.generate(
             repo_path=str(self.repo_path),
@@ -450,52 +695,191 @@ class TestIntegration(unittest.TestCase):
         
         # Verify content structure
         content = output_path.read_text(encoding='utf-8')
-        self.assertIn('# Changelog', content)
-        self.assertIn('## [Unreleased]', content)
-        self.assertIn('### Added', content)
-        self.assertIn('### Fixed', content)
-        self.assertIn('Add feature 1', content)
-        self.assertIn('Fix bug 1', content)
+        self.assertAllIn(['# Changelog', '## [Unreleased]', '### Added', '### Fixed',
+                          'Add feature 1', 'Fix bug 1'], content)
+
+    def test_generate_unsupported_format(self):
+        """Test: Unknown output format raises ValueError without writing a file."""
+        output_path = Path(self.temp_dir) / 'CHANGELOG.pdf'
+
+        with self.assertRaises(ValueError):
+            ChangeLog.generate(repo_path=str(self.repo_path), output_path=str(output_path),
+                               format='pdf', backup=False)
+        self.assertFalse(output_path.exists())
+
+    def test_generate_changelog_only_categories(self):
+        """Test: Category filter keeps only the selected categories."""
+        output_path = Path(self.temp_dir) / 'CHANGELOG.md'
+
+        content = ChangeLog.generate(
+            repo_path=str(self.repo_path),
+            output_path=str(output_path),
+            backup=False,
+            categories=[Category.FIXED]
+        )
+
+        self.assertAllIn(['### Fixed', 'Fix bug 1'], content)
+        self.assertNotIn('### Added', content)
+        self.assertNotIn('Add feature 1', content)
+
+    def test_generate_changelog_with_tags(self):
+        """Test: Each release section holds exactly the commits its tag added."""
+        # Enough commits that workers=2 really starts worker processes, even
+        # after the Fixed pre-filter keeps only every other one
+        count = 2 * PARALLEL_MIN_COMMITS + 10
+        repo_path = Path(self.temp_dir) / 'repo'
+        repo_path.mkdir()
+        git(repo_path, 'init')
+        git_fast_import(repo_path, [
+            (f'f{i}.txt', str(i), f'fix: Fix bug {i}' if i % 2 == 0 else f'feat: Add feature {i}')
+            for i in range(count)
+        ])
+        tag_at = {'v1.0.0': 2, 'v1.1.0': 5, 'v2.0.0': count - 3}
+        for name, index in tag_at.items():
+            git(repo_path, 'tag', name, f'HEAD~{count - 1 - index}')
+        
+        expected = {
+            'Unreleased': set(range(count - 2, count)),
+            '2.0.0': set(range(6, count - 2)),
+            '1.1.0': set(range(3, 6)),
+            '1.0.0': set(range(0, 3)),
+        }
+        output_path = Path(self.temp_dir) / 'CHANGELOG.md'
+        
+        for workers in (1, 2):
+            for categories in (None, [Category.FIXED]):
+                with self.subTest(workers=workers, categories=categories):
+                    content = ChangeLog.generate(
+                        repo_path=str(repo_path), output_path=str(output_path),
+                        backup=False, workers=workers, categories=categories)
+                    
+                    sections = {}
+                    for section in content.split('\n## [')[1:]:
+                        version = section.split(']', 1)[0]
+                        sections[version] = {int(n) for n in re.findall(r'(?:feature|bug) (\d+)', section)}
+                    
+                    wanted = {
+                        version: {i for i in indices if categories is None or i % 2 == 0}
+                        for version, indices in expected.items()
+                    }
+                    self.assertEqual(list(sections), list(expected))
+                    self.assertEqual(sections, wanted)
+    
+    def test_generate_changelog_no_commits_in_categories(self):
+        """Test: Categories that match no commit raise ValueError without writing a file."""
+        # The git pre-filter keeps this commit ("remove"); it categorizes as Deprecated
+        repo_path = Path(self.temp_dir) / 'repo'
+        repo_path.mkdir()
+        git(repo_path, 'init')
+        git_fast_import(repo_path, [('a.txt', 'a', 'fix: remove deprecated bug')])
+        output_path = Path(self.temp_dir) / 'CHANGELOG.md'
+        
+        cases = [
+            (repo_path, [Category.REMOVED]),         # emptied by the category filter
+            (self.repo_path, [Category.CHANGED]),    # no pre-filter for Changed
+            (self.repo_path, [Category.SECURITY]),   # emptied by the git pre-filter
+        ]
+        for repo, categories in cases:
+            with self.subTest(categories=categories):
+                with self.assertRaisesRegex(ValueError, 'selected categories'):
+                    ChangeLog.generate(repo_path=str(repo), output_path=str(output_path),
+                                       backup=False, categories=categories)
+                self.assertFalse(output_path.exists())
 
 
 # ═══════════════════════════════════════════════════════════════════
 # TEST RUNNER
 # ═══════════════════════════════════════════════════════════════════
 
-def run_tests():
-    """Run all tests with nice output."""
+# Every TestCase in this module that has tests, in definition order
+TEST_CLASSES = [
+    obj for obj in list(globals().values())
+    if isinstance(obj, type) and issubclass(obj, unittest.TestCase)
+    and unittest.TestLoader().getTestCaseNames(obj)
+]
+
+
+def run_test_class(name, verbosity=2):
+    """
+    Run one test class and capture its report.
+    
+    Args:
+        name: Name of a class in TEST_CLASSES (classes are sent to worker
+            processes by name and looked up again there)
+        verbosity: TextTestRunner verbosity (0 reports failures only)
+        
+    Returns:
+        Tuple of (report text, tests run, failures, errors, success)
+    """
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(globals()[name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=verbosity).run(suite)
+    return (stream.getvalue(), result.testsRun, len(result.failures),
+            len(result.errors), result.wasSuccessful())
+
+
+def run_tests(serial=False, only=None):
+    """
+    Run all tests with nice output, one worker process per test class.
+    
+    Args:
+        serial: Run the classes one after another in this process
+        only: Name of a single test class to run (default: all of them)
+    """
     print("=" * 70)
     print("TESTING: ChangeLog v1.0.0")
     print("=" * 70)
     
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestGitLogParser))
-    suite.addTests(loader.loadTestsFromTestCase(TestCommitCategorizer))
-    suite.addTests(loader.loadTestsFromTestCase(TestVersionGrouper))
-    suite.addTests(loader.loadTestsFromTestCase(TestChangelogFormatter))
-    suite.addTests(loader.loadTestsFromTestCase(TestOutputWriter))
-    suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Summary
-    print("\n" + "=" * 70)
-    print(f"RESULTS: {result.testsRun} tests")
-    print(f"[OK] Passed: {result.testsRun - len(result.failures) - len(result.errors)}")
-    if result.failures:
-        print(f"[X] Failed: {len(result.failures)}")
-    if result.errors:
-        print(f"[X] Errors: {len(result.errors)}")
-    print("=" * 70)
-    
-    return 0 if result.wasSuccessful() else 1
+    # Slow classes first, so the longest ones start before the pool fills up
+    # (classes without a priority keep their declaration order at the end)
+    classes = TEST_CLASSES
+    if only:
+        classes = [cls for cls in TEST_CLASSES if cls.__name__ == only]
+        if not classes:
+            names = ', '.join(cls.__name__ for cls in TEST_CLASSES)
+            print(f"[X] Unknown test class: {only} (choose from {names})")
+            return 2
+    ordered = sorted(classes, key=lambda cls: -getattr(cls, 'priority', 0))
+    names = [cls.__name__ for cls in ordered]
+    workers = min(len(names), os.cpu_count() or 1)
+    # CHANGELOG_TESTS_FAST=1 (CI, benchmarking) skips the per-test lines
+    verbosity = 0 if os.environ.get('CHANGELOG_TESTS_FAST') == '1' else 2
+    
+    # Classes are independent (each uses its own temp dirs). Worker processes
+    # can only start the categorizer's own process pool on Python 3.9+, where
+    # they are no longer daemonic.
+    if serial or workers <= 1 or sys.version_info < (3, 9):
+        reports = [run_test_class(name, verbosity) for name in names]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = list(executor.map(run_test_class, names,
+                                        [verbosity] * len(names)))
+    
+    tests_run = failures = errors = 0
+    success = True
+    for report, run, failed, errored, ok in reports:
+        sys.stderr.write(report)
+        tests_run += run
+        failures += failed
+        errors += errored
+        success = success and ok
+    
+    # Summary, written in one go
+    lines = ["", "=" * 70, f"RESULTS: {tests_run} tests",
+             f"[OK] Passed: {tests_run - failures - errors}"]
+    if failures:
+        lines.append(f"[X] Failed: {failures}")
+    if errors:
+        lines.append(f"[X] Errors: {errors}")
+    lines.append("=" * 70)
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    return 0 if success else 1
 
 
 if __name__ == "__main__":
-    sys.exit(run_tests())
+    args = sys.argv[1:]
+    only = next((arg.split('=', 1)[1] for arg in args if arg.startswith('--only=')), None)
+    sys.exit(run_tests(serial='--serial' in args, only=only))